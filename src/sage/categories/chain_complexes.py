@@ -156,6 +156,60 @@ class ChainComplexes(Category_module):
                 # if not, this methods needs to be overwritten by parent
                 raise NotImplementedError
 
+class _HomologyMorphism:
+    r"""
+    The map induced on homology by a chain map, as a callable on
+    homology classes.
+
+    This is the function wrapped in the ``SetMorphism`` returned by
+    :meth:`HomologyFunctor._apply_functor_to_morphism`; a dedicated
+    class with slots is cheaper to call than a closure over four free
+    variables, and keeps the induced map picklable.
+
+    TESTS::
+
+        sage: from sage.categories.chain_complexes import _HomologyMorphism
+        sage: C = ChainComplex({0: matrix(ZZ, 2, 3, [3, 0, 0, 0, 0, 0])})
+        sage: f = Hom(C, C)({0: identity_matrix(ZZ, 3), 1: identity_matrix(ZZ, 2)})
+        sage: phi = _HomologyMorphism(f, 1)
+        sage: phi._n
+        1
+    """
+    __slots__ = ('_f', '_lift', '_reduce', '_n')
+
+    def __init__(self, f, n):
+        r"""
+        TESTS::
+
+            sage: from sage.categories.chain_complexes import _HomologyMorphism
+            sage: C = ChainComplex({0: matrix(ZZ, 2, 3, [3, 0, 0, 0, 0, 0])})
+            sage: f = Hom(C, C)({0: identity_matrix(ZZ, 3), 1: identity_matrix(ZZ, 2)})
+            sage: _HomologyMorphism(f, None)._f is f
+            True
+        """
+        self._f = f
+        self._lift = f.domain().lift_from_homology
+        self._reduce = f.codomain().reduce_to_homology
+        self._n = n
+
+    def __call__(self, x):
+        r"""
+        Apply the induced map to the homology class ``x``.
+
+        TESTS::
+
+            sage: E3 = EuclideanSpace(3)                    # optional - sage.symbolic
+            sage: C = E3.de_rham_complex()                  # optional - sage.symbolic
+            sage: H = HomologyFunctor(ChainComplexes(SR))   # optional - sage.symbolic
+            sage: f = Hom(C, C).identity()                  # optional - sage.symbolic
+            sage: from sage.categories.chain_complexes import _HomologyMorphism
+            sage: phi = _HomologyMorphism(f, None)          # optional - sage.symbolic
+            sage: phi(C.homology().one())                   # optional - sage.symbolic
+            [one]
+        """
+        return self._reduce(self._f(self._lift(x)), self._n)
+
+
 class HomologyFunctor(Functor):
     r"""
     Homology functor.
@@ -244,21 +298,42 @@ class HomologyFunctor(Functor):
             sage: id = Hom(C, C).identity()                     # optional - sage.symbolic
             sage: H = HomologyFunctor(ChainComplexes(SR))       # optional - sage.symbolic
             sage: id_star = H(id); id_star                      # optional - sage.symbolic
-            Generic endomorphism of De Rham cohomology ring on the
+            Identity endomorphism of De Rham cohomology ring on the
              Euclidean space E^3
             sage: one = H(C).one()                              # optional - sage.symbolic
             sage: id_star(one)                                  # optional - sage.symbolic
             [one]
+
+        The zero chain map induces the zero map on homology, with no
+        lifting or reduction of representatives::
+
+            sage: S = simplicial_complexes.Sphere(1)
+            sage: C = S.chain_complex()
+            sage: H = HomologyFunctor(ChainComplexes(ZZ), 1)
+            sage: z = Hom(C, C)({0: zero_matrix(ZZ, 3), 1: zero_matrix(ZZ, 3)})
+            sage: z_star = H(z)
+            sage: z_star(H(C).gen(0)) == H(C).zero()
+            True
         """
         from .morphism import SetMorphism
         from .homset import Hom
 
         domain = f.domain()
         codomain = f.codomain()
-        lift = domain.lift_from_homology
-        reduce = codomain.reduce_to_homology
-        apply_f_star = lambda x: reduce(f(lift(x)), self._n)
-        return SetMorphism(Hom(domain.homology(self._n),
-                               codomain.homology(self._n),
-                               CommutativeAdditiveGroups()),
-                           apply_f_star)
+        hom = Hom(domain.homology(self._n), codomain.homology(self._n),
+                  CommutativeAdditiveGroups())
+
+        # Short-circuit the zero and identity chain maps, which induce
+        # the zero and the identity map on homology; neither needs any
+        # lifting or reduction of representatives.
+        if f.is_zero():
+            zero = codomain.homology(self._n).zero()
+            return SetMorphism(hom, lambda x: zero)
+        if domain is codomain:
+            try:
+                if f.is_identity():
+                    return hom.identity()
+            except (TypeError, NotImplementedError):
+                pass
+
+        return SetMorphism(hom, _HomologyMorphism(f, self._n))
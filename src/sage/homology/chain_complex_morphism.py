@@ -522,6 +522,22 @@ class ChainComplexMorphism(Morphism):
                 and self.domain() == x.domain() \
                 and self._matrix_dictionary == x._matrix_dictionary
 
+    def __bool__(self):
+        """
+        Return ``True`` if this is not the zero chain map.
+
+        EXAMPLES::
+
+            sage: S = simplicial_complexes.Sphere(1)
+            sage: C = S.chain_complex()
+            sage: G = Hom(C, C)
+            sage: bool(G({0: identity_matrix(ZZ, 3), 1: identity_matrix(ZZ, 3)}))
+            True
+            sage: G({0: zero_matrix(ZZ, 3), 1: zero_matrix(ZZ, 3)}).is_zero()
+            True
+        """
+        return any(m for m in self._matrix_dictionary.values())
+
     def is_identity(self):
         """
         True if this is the identity map.
@@ -53,6 +53,8 @@ AUTHORS:
 from sage.rings.finite_rings.finite_field_constructor import GF
 from sage.rings.integer_ring import ZZ
 from sage.arith.misc import kronecker as kro
+from sage.parallel.decorate import parallel
+from sage.schemes.elliptic_curves.constructor import EllipticCurve
 from sage.structure.sage_object import SageObject
 
 def reduce_mod_q(x,amodq):
@@ -91,6 +93,352 @@ def reduce_mod_q(x,amodq):
     except AttributeError: # in case x is in QQ
         return Fq(x)
 
+_gf_cache = dict()
+
+def _gf(q):
+    r"""Return `GF(q)` for a prime ``q``, cached.
+
+    The field is taken from a module-level dict keyed by the int value
+    of ``q``; this is cheaper than going through the finite field
+    factory for every sieve prime.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _gf
+        sage: _gf(7) is GF(7) is _gf(7)
+        True
+    """
+    q = int(q)
+    try:
+        return _gf_cache[q]
+    except KeyError:
+        F = _gf_cache[q] = GF(q)
+        return F
+
+def _projective_tuples(p, n):
+    r"""Iterate over the points of the projective space of dimension `n-1`
+    over `\GF{p}`, as plain tuples of ints.
+
+    The tuples are normalized so that the last nonzero entry is 1, and
+    are produced in the same order as the iterator of
+    ``ProjectiveSpace(GF(p), n-1)``, but without constructing any
+    scheme or point objects.
+
+    INPUT:
+
+    - ``p`` (int) -- a prime number.
+
+    - ``n`` (int) -- the number of coordinates.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _projective_tuples
+        sage: list(_projective_tuples(2, 3))
+        [(0, 0, 1), (0, 1, 1), (1, 0, 1), (1, 1, 1), (0, 1, 0), (1, 1, 0), (1, 0, 0)]
+        sage: all(tuple(v) == w for v, w in
+        ....:     zip(ProjectiveSpace(GF(3), 2), _projective_tuples(3, 3)))
+        True
+    """
+    from itertools import product
+    for i in range(n - 1, -1, -1):
+        tail = (1,) + (0,) * (n - 1 - i)
+        for head in product(range(p), repeat=i):
+            yield head + tail
+
+def _p_primary_gens(Eq, p):
+    r"""Return generators of the `p`-primary part of the group of points
+    of `Eq`.
+
+    INPUT:
+
+    - ``Eq`` -- an elliptic curve over a finite field.
+
+    - ``p`` -- a prime number.
+
+    OUTPUT:
+
+    A list of 1 or 2 points generating the `p`-primary part of
+    `Eq(\GF{q})`, its length being the `p`-rank; the points are listed
+    with non-increasing orders.  If the `p`-primary part is trivial an
+    empty list is returned.
+
+    Unlike ``Eq.abelian_group()`` this computes no generators of the
+    full group and needs no discrete logarithms: random points are
+    multiplied into the `p`-primary part, and the Weil pairing detects
+    when the points found generate a subgroup of full order.  If the
+    random search is unlucky we fall back to the full group structure.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _p_primary_gens
+        sage: EF = EllipticCurve(GF(409), [0, 0, 1, -7, 6])
+        sage: EF.abelian_group().invariants()
+        (3, 147)
+        sage: sorted(g.order() for g in _p_primary_gens(EF, 3))
+        [3, 3]
+        sage: [g.order() for g in _p_primary_gens(EF, 7)]
+        [49]
+        sage: _p_primary_gens(EF, 5)
+        []
+    """
+    n = Eq.cardinality()
+    m = n.prime_to_m_part(p)
+    pp = n // m  # order of the p-primary part
+    if pp == 1:
+        return []
+    g1 = None
+    o1 = ZZ(1)
+    for _ in range(20):
+        T = m * Eq.random_point()
+        # the order of T is a power of p
+        oT = ZZ(1)
+        S = T
+        while S:
+            S = p * S
+            oT *= p
+        if oT == 1:
+            continue
+        if oT > o1:
+            g1, o1 = T, oT
+        if o1 == pp:
+            return [g1]
+        if T is not g1:
+            # g1 and T generate a subgroup of order at least o1*e
+            # where e is the order of their Weil pairing, so they
+            # generate the whole p-primary part as soon as o1*e == pp
+            e = g1.weil_pairing(T, o1).multiplicative_order()
+            if o1 * e == pp:
+                return [g1, T]
+    # the random search was unlucky: fall back to the full group
+    # structure
+    gens = [m * g.element() for g in Eq.abelian_group().gens()]
+    gens = [g for g in gens if g]
+    gens.sort(key=lambda g: g.order(), reverse=True)
+    return gens
+
+def _linear_combination(v, Plist, zero):
+    r"""Return `\sum_i v_i P_i`, skipping the trivial terms.
+
+    INPUT:
+
+    - ``v`` -- a list of coefficients (ints or elements of `GF(p)`).
+
+    - ``Plist`` (list) -- a list of points on an elliptic curve.
+
+    - ``zero`` -- the zero point of the curve.
+
+    Terms with coefficient 0 are skipped entirely and coefficient 1
+    contributes the point itself without a scalar multiplication; the
+    kernel basis vectors this is applied to are typically sparse with
+    most entries 0 or 1.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _linear_combination
+        sage: E = EllipticCurve('389a')
+        sage: P, Q = E(-1, 1), E(0, 0)
+        sage: _linear_combination([2, 0], [P, Q], E(0)) == 2*P
+        True
+        sage: _linear_combination([1, 3], [P, Q], E(0)) == P + 3*Q
+        True
+        sage: _linear_combination([0, 0], [P, Q], E(0))
+        (0 : 1 : 0)
+    """
+    acc = zero
+    for vi, Pi in zip(v, Plist):
+        vi = int(vi)
+        if vi == 0:
+            continue
+        acc += Pi if vi == 1 else vi * Pi
+    return acc
+
+def _update_echelon(pivots, row, p):
+    r"""Reduce ``row`` against the rows of ``pivots``, inserting it if
+    independent.
+
+    This maintains a matrix over `GF(p)` in reduced row-echelon form as
+    a list of (pivot column, row) pairs sorted by pivot column, each
+    row being a plain list of ints mod `p`.
+
+    INPUT:
+
+    - ``pivots`` (list) -- (pivot column, row) pairs, updated in place.
+
+    - ``row`` (list) -- a list of ints representing a vector mod `p`.
+
+    - ``p`` (int) -- a prime number.
+
+    OUTPUT:
+
+    ``True`` if ``row`` is independent of the rows of ``pivots``, in
+    which case a reduced multiple of it is inserted, else ``False``.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _update_echelon
+        sage: pivots = []
+        sage: _update_echelon(pivots, [0, 2, 4], 5)
+        True
+        sage: _update_echelon(pivots, [0, 1, 2], 5)
+        False
+        sage: _update_echelon(pivots, [1, 1, 1], 5)
+        True
+        sage: pivots
+        [(0, [1, 0, 4]), (1, [0, 1, 2])]
+    """
+    for c, r in pivots:
+        a = row[c]
+        if a:
+            row = [(x - a * y) % p for x, y in zip(row, r)]
+    j = next((i for i, x in enumerate(row) if x), None)
+    if j is None:
+        return False
+    ainv = pow(row[j], -1, p)
+    row = [x * ainv % p for x in row]
+    # reduce the existing rows against the new one, to keep the whole
+    # list in reduced row-echelon form
+    for k, (c, r) in enumerate(pivots):
+        a = r[j]
+        if a:
+            pivots[k] = (c, [(x - a * y) % p for x, y in zip(r, row)])
+    pivots.append((j, row))
+    pivots.sort()
+    return True
+
+def _echelon_kernel(pivots, n, p):
+    r"""Return a basis of the right kernel of the matrix with rows ``pivots``.
+
+    INPUT:
+
+    - ``pivots`` (list) -- (pivot column, row) pairs in reduced
+      row-echelon form, as maintained by :func:`_update_echelon`.
+
+    - ``n`` (int) -- the number of columns.
+
+    - ``p`` (int) -- a prime number.
+
+    OUTPUT:
+
+    A list of vectors (as lists of ints mod `p`) spanning the right
+    kernel, one for each non-pivot column.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import _echelon_kernel
+        sage: _echelon_kernel([(0, [1, 0, 4]), (1, [0, 1, 2])], 3, 5)
+        [[1, 3, 1]]
+        sage: matrix(GF(5), [[1, 0, 4], [0, 1, 2]]) * vector(GF(5), [1, 3, 1])
+        (0, 0)
+    """
+    pivot_cols = set(c for c, r in pivots)
+    basis = []
+    for j in range(n):
+        if j in pivot_cols:
+            continue
+        v = [0] * n
+        v[j] = 1
+        for c, r in pivots:
+            v[c] = -r[j] % p
+        basis.append(v)
+    return basis
+
+class ResidueMap(SageObject):
+    r"""The reduction map from a number field `K` to the residue field
+    of the degree 1 prime ideal `Q=(q,\alpha-a)` defined by ``amodq``.
+
+    This computes the same map as :func:`reduce_mod_q`, but the powers
+    of ``amodq`` are computed once in advance, so that reducing many
+    elements avoids rebuilding a polynomial over `GF(q)` and a fresh
+    polynomial parent for each of them.
+
+    INPUT:
+
+    - ``amodq`` -- an element of `GF(q)` which is a root mod `q` of
+      the defining polynomial of `K`.
+
+    - ``deg`` -- the degree of the defining polynomial of `K`.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import ResidueMap
+        sage: x = polygen(QQ)
+        sage: pol = x^3 - x^2 - 3*x + 1
+        sage: K.<a> = NumberField(pol)
+        sage: amodq = pol.roots(GF(59), multiplicities=False)[0]
+        sage: rm = ResidueMap(amodq, pol.degree())
+        sage: rm(1 - a + a^4)
+        28
+        sage: from sage.schemes.elliptic_curves.saturation import reduce_mod_q
+        sage: all(rm(e) == reduce_mod_q(e, amodq) for e in [K(0), K(1/2), a, a^2 - 3])
+        True
+    """
+    def __init__(self, amodq, deg):
+        r"""
+        Initialize the map, precomputing the powers of ``amodq``.
+
+        TESTS::
+
+            sage: from sage.schemes.elliptic_curves.saturation import ResidueMap
+            sage: rm = ResidueMap(GF(7)(3), 3)
+            sage: rm._powers
+            [1, 3, 2]
+        """
+        Fq = amodq.parent()
+        self._Fq = Fq
+        apow = Fq.one()
+        powers = [apow]
+        for _ in range(deg - 1):
+            apow *= amodq
+            powers.append(apow)
+        self._powers = powers
+
+    def __call__(self, x):
+        r"""
+        Return the image of ``x`` in the residue field.
+
+        TESTS::
+
+            sage: from sage.schemes.elliptic_curves.saturation import ResidueMap
+            sage: x = polygen(QQ); K.<a> = NumberField(x^2 + 2)
+            sage: amodq = min((x^2 + 2).roots(GF(11), multiplicities=False))
+            sage: ResidueMap(amodq, 2)(a + 1/3)
+            7
+        """
+        try:
+            coeffs = x.lift().list()
+        except AttributeError: # in case x is in QQ
+            return self._Fq(x)
+        return self.reduce_coeffs(coeffs)
+
+    def reduce_coeffs(self, coeffs):
+        r"""Return the image in the residue field of the element of `K` with
+        the given coefficients.
+
+        INPUT:
+
+        - ``coeffs`` (list) -- the rational coefficients of an element
+          of `K` with respect to the power basis, as returned by
+          ``x.lift().list()``.
+
+        This allows the lift, which does not depend on the prime, to be
+        computed once per element and shared between the reductions at
+        many primes.
+
+        TESTS::
+
+            sage: from sage.schemes.elliptic_curves.saturation import ResidueMap
+            sage: x = polygen(QQ); K.<a> = NumberField(x^2 + 2)
+            sage: amodq = min((x^2 + 2).roots(GF(11), multiplicities=False))
+            sage: rm = ResidueMap(amodq, 2)
+            sage: rm.reduce_coeffs((a + 1/3).lift().list()) == rm(a + 1/3)
+            True
+        """
+        Fq = self._Fq
+        res = Fq.zero()
+        for c, apow in zip(coeffs, self._powers):
+            res += Fq(c) * apow
+        return res
+
 class EllipticCurveSaturator(SageObject):
     r"""
     Class for saturating points on an elliptic curve over a number field.
@@ -119,6 +467,7 @@ class EllipticCurveSaturator(SageObject):
         """
         self._verbose = verbose
         self._curve = E
+        self._zero_point = E(0)
         self._N = E.discriminant().norm()
         self._field = K = E.base_field()
         if K.absolute_degree() == 1:
@@ -132,11 +481,229 @@ class EllipticCurveSaturator(SageObject):
         self._lincombs = dict()
         self._torsion_gens = [t.element() for t in E.torsion_subgroup().gens()]
         self._reductions = dict()
+        self._residue_maps = dict()
+        # This will hold a dictionary with keys (q,aq) as for
+        # self._reductions and values the associated ResidueMap, so
+        # that the map is only constructed once per prime ideal.
+        self._multiples = dict()
+        # This will hold a dictionary with keys (P,m) with P a point
+        # and m a positive integer, and values the tuple of multiples
+        # (0*P, ..., (m-1)*P), shared between the repeated calls to
+        # the exhaustive branch of p_saturation.
+        self._indivisible = set()
+        # This will hold the pairs (p,R) for which the (expensive)
+        # division of the point R by the prime p has been attempted
+        # and failed; indivisibility depends only on the pair, so such
+        # tests need never be repeated.
+        self._denom_norms = dict()
+        # This will hold a dictionary with keys the points whose
+        # denominator ideal norms have been computed and values those
+        # norms.
+        self._denom_primes = dict()
+        # This will hold a dictionary with keys points and values the
+        # sets of rational primes dividing their denominator norms.
+        self._disc_primes = None
+        # This will hold the set of rational primes dividing the
+        # discriminant norm of E or the discriminant of the defining
+        # polynomial of K, computed on first use by p_saturation.
         # This will hold a dictionary with keys (q,aq) with q prime
         # and aq a root of K's defining polynomial mod q, and values
         # (n,gens) where n is the cardinality of the reduction of E
         # and gens are generators of that reduction.
 
+    def _denominator_norm(self, P):
+        r"""Return the norm of the denominator ideal of the `x`-coordinate
+        of ``P``, cached.
+
+        Between the successive calls to :meth:`p_saturation` made by
+        :meth:`full_p_saturation` at most one entry of the point list
+        changes, so the norms (which require an ideal norm computation
+        each) are computed once per point rather than once per call.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: K.<i> = QuadraticField(-1)
+            sage: EK = EllipticCurve('389a').change_ring(K)
+            sage: saturator = EllipticCurveSaturator(EK)
+            sage: saturator._denominator_norm(EK(10/9, -35/27))
+            81
+        """
+        try:
+            return self._denom_norms[P]
+        except KeyError:
+            nm = self._denom_norms[P] = P[0].denominator_ideal().norm()
+            return nm
+
+    def _denominator_primes(self, P):
+        r"""Return the set of rational primes dividing the denominator
+        norm of ``P``, cached.
+
+        The sieve in :meth:`p_saturation` must skip primes dividing
+        the denominator of any point; factoring each norm once and
+        testing set membership is much cheaper than one divisibility
+        test per point for every candidate prime.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: K.<i> = QuadraticField(-1)
+            sage: EK = EllipticCurve('389a').change_ring(K)
+            sage: saturator = EllipticCurveSaturator(EK)
+            sage: saturator._denominator_primes(EK(10/9, -35/27))
+            frozenset({3})
+        """
+        try:
+            return self._denom_primes[P]
+        except KeyError:
+            pr = self._denom_primes[P] = frozenset(
+                int(l) for l in ZZ(self._denominator_norm(P)).prime_divisors())
+            return pr
+
+    def _division_points(self, R, p):
+        r"""Return the points `S` with `pS=R`, remembering failures.
+
+        The sieve in :meth:`p_saturation` can reach the same rank
+        plateau repeatedly while :meth:`full_p_saturation` gains index
+        elsewhere, retesting the divisibility of an unchanged kernel
+        point.  A failed division is the most expensive step of the
+        whole computation and depends only on ``(p, R)``, so it is
+        never repeated.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: E = EllipticCurve('389a')
+            sage: saturator = EllipticCurveSaturator(E)
+            sage: P = E(-1, 1)
+            sage: saturator._division_points(2*P, 2)
+            [(-1 : 1 : 1)]
+            sage: saturator._division_points(P, 2)
+            []
+            sage: (2, P) in saturator._indivisible
+            True
+        """
+        if (p, R) in self._indivisible:
+            return []
+        pts = R.division_points(p)
+        if not pts:
+            self._indivisible.add((p, R))
+        return pts
+
+    def _get_multiples(self, P, m):
+        r"""Return the tuple ``(0*P, 1*P, ..., (m-1)*P)``, cached.
+
+        The exhaustive (non-sieve) branch of :meth:`p_saturation` is
+        called repeatedly on overlapping lists of points while
+        :meth:`full_p_saturation` gains index, and this caching means
+        that the multiples of the unchanged points are only computed
+        once.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: E = EllipticCurve('389a')
+            sage: saturator = EllipticCurveSaturator(E)
+            sage: saturator._get_multiples(E(-1, 1), 3)
+            ((0 : 1 : 0), (-1 : 1 : 1), (10/9 : -35/27 : 1))
+            sage: saturator._get_multiples(E(-1, 1), 3) is saturator._get_multiples(E(-1, 1), 3)
+            True
+        """
+        try:
+            return self._multiples[(P, m)]
+        except KeyError:
+            from sage.groups.generic import multiples
+            mults = tuple(multiples(P, m))
+            self._multiples[(P, m)] = mults
+            return mults
+
+    def residue_map(self, q, amodq):
+        r"""Return a cached :class:`ResidueMap` defined by the root ``amodq``
+        of the defining polynomial of the base field modulo ``q``.
+
+        INPUT:
+
+        - ``q`` -- a prime number.
+
+        - ``amodq`` -- an element of `GF(q)` which is a root mod `q` of
+          the defining polynomial of the base field.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: x = polygen(QQ);  K.<a> = NumberField(x^2 + 2)
+            sage: E = EllipticCurve(K, [0,1,0,a,a])
+            sage: saturator = EllipticCurveSaturator(E)
+            sage: amodq = min((x^2 + 2).roots(GF(11), multiplicities=False))
+            sage: saturator.residue_map(11, amodq)(a)
+            3
+            sage: saturator.residue_map(11, amodq) is saturator.residue_map(11, amodq)
+            True
+        """
+        try:
+            return self._residue_maps[(q, amodq)]
+        except KeyError:
+            rm = ResidueMap(amodq, self._Kpol.degree())
+            self._residue_maps[(q, amodq)] = rm
+            return rm
+
+    def _Kpol_roots(self, q):
+        r"""Return the sorted roots of the defining polynomial of the base
+        field modulo the prime ``q``.
+
+        This computes the same roots as ``self._Kpol.roots(GF(q),
+        multiplicities=False)`` but more quickly: for quadratic fields
+        the quadratic is solved directly with a single square root in
+        `GF(q)`, while for higher degree fields the primes with no
+        roots at all (roughly half of them) are screened out with one
+        modular exponentiation and a gcd before any factorization is
+        attempted.
+
+        EXAMPLES::
+
+            sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator
+            sage: x = polygen(QQ);  K.<a> = NumberField(x^2 + 2)
+            sage: E = EllipticCurve(K, [0,1,0,a,a])
+            sage: saturator = EllipticCurveSaturator(E)
+            sage: saturator._Kpol_roots(11)
+            [3, 8]
+            sage: saturator._Kpol_roots(13)
+            []
+
+        TESTS::
+
+            sage: x = polygen(QQ);  K.<a> = NumberField(x^3 - x^2 - 3*x + 1)
+            sage: E = EllipticCurve(K, [0,1,0,a,a])
+            sage: saturator = EllipticCurveSaturator(E)
+            sage: all(saturator._Kpol_roots(q) ==
+            ....:     sorted((x^3 - x^2 - 3*x + 1).roots(GF(q), multiplicities=False))
+            ....:     for q in primes(50, 100))
+            True
+        """
+        pol = self._Kpol.change_ring(_gf(q))
+        d = pol.degree()
+        if d == 1:
+            return [-pol[0] / pol[1]]
+        if d == 2 and q != 2:
+            b, c = pol[1], pol[0]
+            lc = pol[2]
+            disc = b * b - 4 * lc * c
+            if not disc.is_square():
+                return []
+            s = disc.sqrt()
+            r1 = (s - b) / (2 * lc)
+            r2 = (-s - b) / (2 * lc)
+            return [r1] if r1 == r2 else sorted([r1, r2])
+        # pol has a root in GF(q) if and only if gcd(pol, x^q - x) has
+        # positive degree, and that gcd is the product of the distinct
+        # linear factors of pol
+        from sage.arith.misc import power_mod
+        x = pol.parent().gen()
+        g = pol.gcd(power_mod(x, q, pol) - x)
+        if g.degree() < 1:
+            return []
+        return sorted(g.roots(multiplicities=False))
+
     def add_reductions(self, q):
         r"""Add reduction data at primes above q if not already there.
 
@@ -200,9 +767,9 @@ class EllipticCurveSaturator(SageObject):
         self._reductions[q] = redmodq = dict()
         if q.divides(self._N) or q.divides(self._D):
             return
-        from sage.schemes.elliptic_curves.all import EllipticCurve
-        for amodq in sorted(self._Kpol.roots(GF(q), multiplicities=False)):
-            Eq = EllipticCurve([reduce_mod_q(ai, amodq) for ai in self._curve.ainvs()])
+        for amodq in self._Kpol_roots(q):
+            rm = self.residue_map(q, amodq)
+            Eq = EllipticCurve([rm(ai) for ai in self._curve.ainvs()])
             nq = Eq.cardinality()
             redmodq[amodq] = (nq, Eq)
 
@@ -425,7 +992,7 @@ class EllipticCurveSaturator(SageObject):
             return False
 
         if n == 1 and p == 2:
-            pts = Plist[0].division_points(p)
+            pts = self._division_points(Plist[0], p)
             if pts:
                 return (0, pts[0])
             else:
@@ -434,15 +1001,16 @@ class EllipticCurveSaturator(SageObject):
         E = self._curve
 
         if not sieve:
-            from sage.groups.generic import multiples
-            from sage.schemes.projective.projective_space import ProjectiveSpace
-
-            mults = [list(multiples(P, p)) for P in Plist[:-1]] + [list(multiples(Plist[-1],2))]
-            E0 = E(0)
-
-            for v in ProjectiveSpace(GF(p),n-1): # an iterator
-                w = tuple(int(x) for x in v)
-                P = sum([m[c] for m,c in zip(mults,w)],E0)
+            mults = [self._get_multiples(P, p) for P in Plist[:-1]] + [self._get_multiples(Plist[-1], 2)]
+
+            for w in _projective_tuples(int(p), n): # an iterator
+                # w has at least one nonzero coordinate, so seed the
+                # sum with the first nonzero term instead of the zero
+                # point
+                P = None
+                for m, c in zip(mults, w):
+                    if c:
+                        P = m[c] if P is None else P + m[c]
                 pts = P.division_points(p)
                 if pts:
                     if verbose:
@@ -459,10 +1027,16 @@ class EllipticCurveSaturator(SageObject):
 
         if verbose:
             print("Using sieve method to saturate...")
-        from sage.matrix.constructor import matrix
         from sage.sets.primes import Primes
 
-        A = matrix(GF(p), 0, n)
+        # The projection vectors accumulated so far are kept in reduced
+        # row-echelon form over GF(p), as a list of (pivot column, row)
+        # pairs with each row a plain list of ints; appending a vector
+        # and updating the rank is then linear in the size of the
+        # matrix, instead of rebuilding and re-echelonizing a Sage
+        # matrix for every new vector.
+        pint = int(p)
+        pivots = []
         rankA = 0
         count = 0
 
@@ -491,102 +1065,254 @@ class EllipticCurveSaturator(SageObject):
         # requires q=617011. (In the split case the density is 1/(p-1)
         # and there is no simple test.)
 
-        avoid = [self._N, self._D] + [P[0].denominator_ideal().norm() for P in Plist]
+        # None of the quantities to avoid change during the sieve, so
+        # they are factored once into a set of primes and the test in
+        # good_primes() below is a single hash lookup rather than one
+        # divisibility check per point for every candidate q.  The
+        # discriminant primes are shared between all calls.
+        if self._disc_primes is None:
+            self._disc_primes = frozenset(
+                int(l) for m in (self._N, self._D)
+                for a in (m.numerator(), m.denominator())
+                for l in ZZ(a).prime_divisors())
+        bad_primes = set(self._disc_primes)
+        for P in Plist:
+            bad_primes.update(self._denominator_primes(P))
         cm_test = E.has_rational_cm() and kro(E.cm_discriminant(), p)==-1
-        for q in Primes():
-            if any(q.divides(m) for m in avoid):
-                continue
-            if cm_test and not p.divides(q-1):
-                continue
-            self.add_reductions(q) # does nothing if key q is already there
-            for amodq in self._reductions[q]:
-                (nq, Eq) = self._reductions[q][amodq]
-                if not p.divides(nq):
+
+        # Lift the coordinates of the points to their coefficient lists
+        # once and for all: the lifts do not depend on q, so reduction
+        # at each prime only has to evaluate the cached lists.  (Over
+        # QQ the coordinates are rational and there is nothing to
+        # lift.)
+        try:
+            Pcoeffs = [[c.lift().list() for c in pt] for pt in Plist]
+        except AttributeError:
+            Pcoeffs = None
+
+        # Bind the attributes used on every prime to locals: the loop
+        # below runs for hundreds of primes q and its bookkeeping is
+        # pure Python dispatch.
+        reductions = self._reductions
+        add_reductions = self.add_reductions
+        residue_map = self.residue_map
+
+        # For a quadratic field, whether q has a degree 1 prime above
+        # it is decided by a single Kronecker symbol, which is far
+        # cheaper than reducing the defining polynomial mod q; roughly
+        # half of all primes are inert and skipped this way.  (For
+        # higher degree fields _Kpol_roots screens out the rootless
+        # primes with a power-mod gcd instead.)
+        quad_disc = None
+        if self._Kpol.degree() == 2 and self._Kpol.is_monic():
+            try:
+                quad_disc = ZZ(self._D)
+            except TypeError:
+                pass
+
+        def good_primes():
+            # the sieve primes, filtered as described above
+            for q in Primes():
+                qint = int(q)
+                if qint in bad_primes:
+                    continue
+                if cm_test and (qint - 1) % pint:
                     continue
-                if verbose:
-                    print("E has %s-torsion over %s, projecting points" % (p,GF(q)))
-                projPlist = [Eq([reduce_mod_q(c, amodq) for c in pt]) for pt in Plist]
-                if verbose:
-                    print(" --> %s" % projPlist)
-                try:
-                    vecs = p_projections(Eq, projPlist, p)
-                except ValueError:
-                    vecs = []
-                for v in vecs:
-                    A = matrix(A.rows()+[v])
-                    newrank = A.rank()
+                if quad_disc is not None and kro(quad_disc, qint) == -1:
+                    continue
+                yield q
+
+        def projections_serial():
+            for q in good_primes():
+                add_reductions(q) # does nothing if key q is already there
+                for amodq, (nq, Eq) in reductions[q].items():
+                    if nq % pint:
+                        continue
+                    rm = residue_map(q, amodq)
+                    if Pcoeffs is None:
+                        projPlist = [Eq([rm(c) for c in pt]) for pt in Plist]
+                    else:
+                        projPlist = [Eq([rm.reduce_coeffs(cl) for cl in coeffs])
+                                     for coeffs in Pcoeffs]
+                    try:
+                        vecs = p_projections(Eq, projPlist, p)
+                    except ValueError:
+                        vecs = []
+                    yield q, projPlist, vecs
+
+        def projections_parallel(nc):
+            # process windows of nc sieve primes at a time, but
+            # integrate the results in increasing order of q so that
+            # the sieve consumes exactly the same stream of vectors as
+            # in the serial case
+            from itertools import islice
+            cands = good_primes()
+            while True:
+                window = list(islice(cands, nc))
+                results = dict()
+                for ((args, kwds), res) in _sieve_prime([(self, p, q, Plist)
+                                                         for q in window]):
+                    results[args[2]] = res
+                for q in window:
+                    res = results.get(q)
+                    if not isinstance(res, tuple):
+                        # the worker failed (e.g. 'NO DATA'); redo the
+                        # prime here
+                        res = _sieve_prime(self, p, q, Plist)
+                    redmodq, hits = res
+                    reductions.setdefault(q, redmodq)
+                    for projPlist, vecs in hits:
+                        yield q, projPlist, vecs
+
+        # The work at each prime (reduction of the curve and points,
+        # group structure, projections) is independent of all the
+        # others, so it can be distributed over the available cpus.
+        # For n <= 2 the first couple of primes almost always settle
+        # the question and forking would cost more than it saves.
+        nc = 1
+        if n > 2:
+            from sage.parallel.ncpus import ncpus
+            nc = ncpus()
+        stream = projections_parallel(nc) if nc > 1 else projections_serial()
+
+        for q, projPlist, vecs in stream:
+            if verbose:
+                print("E has %s-torsion over %s, projecting points" % (p,_gf(q)))
+                print(" --> %s" % projPlist)
+            for v in vecs:
+                if _update_echelon(pivots, [int(x) for x in v], pint):
+                    # rank went up
+                    rankA += 1
+                    count = 0
                     if verbose:
-                        print(" --rank is now %s" % newrank)
-                    if newrank == n:
+                        print(" --rank is now %s" % rankA)
+                    if rankA == n:
                         if verbose:
                             print("Reached full rank: points were %s-saturated" % p)
                         return False
-                    if newrank == rankA:
-                        count += 1
-                        if count == 15:
-                            if verbose:
-                                print("! rank same for 15 steps, checking kernel...")
-                            # no increase in rank for the last 15 primes Q
-                            # find the points in the kernel and call the no-sieve version
-                            vecs = A.right_kernel().basis()
-                            if verbose:
-                                print("kernel vectors: %s" % vecs)
-                            Rlist = [sum([int(vi)*Pi for vi,Pi in zip(v,Plist)],E(0))
-                                     for v in vecs]
-                            if verbose:
-                                print("points generating kernel: %s" % Rlist)
-
-                            # If the nullity of A were 1 (the usual
-                            # case) we take any nonzero vector in its
-                            # kernel and compute that linear
-                            # combination of the points, giving a
-                            # point which is certainly a p-multiple
-                            # modulo 15 primes Q, and we test if it
-                            # actually is a p-multiple:
-                            if len(Rlist)==1:
-                                R = Rlist[0]
-                                pts = R.division_points(p)
-                                if pts:
-                                    pt = pts[0]
-                                    v = vecs[0]
-                                    # replace one of the original
-                                    # points with this one; we can
-                                    # replace any for which the
-                                    # coefficient of v is nonzero
-                                    if verbose:
-                                        print("-- points were not {}-saturated, gaining index {}".format(p,p))
-                                    j = next(i for i,x in enumerate(v) if x)
-                                    return (j, pt)
-                                else: # R is not a p-multiple so the
-                                      # points were p-saturated
-                                    return False
-
-                            # Else we call the non-sieve version with
-                            # a list of points which are all
-                            # p-multiples modulo 15 primes, and we
-                            # will just try to divide all linear
-                            # combinations of them
-                            res = self.p_saturation(Rlist, p, sieve=False)
-                            if res:
-                                jj, R = res
-                                v = vecs[jj]
-                                # The v-linear combination of Rlist
-                                # really is p*R.  Now to enlarge the
-                                # span, we may replce the j'th point
-                                # in Plist with R, where v[j] is
-                                # non-zero.
+                else:
+                    if verbose:
+                        print(" --rank is now %s" % rankA)
+                    count += 1
+                    if count == 15:
+                        if verbose:
+                            print("! rank same for 15 steps, checking kernel...")
+                        # no increase in rank for the last 15 primes Q
+                        # find the points in the kernel and call the no-sieve version
+                        vecs = _echelon_kernel(pivots, n, pint)
+                        if verbose:
+                            print("kernel vectors: %s" % vecs)
+                        E0 = self._zero_point
+                        Rlist = [_linear_combination(v, Plist, E0)
+                                 for v in vecs]
+                        if verbose:
+                            print("points generating kernel: %s" % Rlist)
+
+                        # If the nullity of A were 1 (the usual
+                        # case) we take any nonzero vector in its
+                        # kernel and compute that linear
+                        # combination of the points, giving a
+                        # point which is certainly a p-multiple
+                        # modulo 15 primes Q, and we test if it
+                        # actually is a p-multiple:
+                        if len(Rlist)==1:
+                            R = Rlist[0]
+                            pts = self._division_points(R, p)
+                            if pts:
+                                pt = pts[0]
+                                v = vecs[0]
+                                # replace one of the original
+                                # points with this one; we can
+                                # replace any for which the
+                                # coefficient of v is nonzero
                                 if verbose:
                                     print("-- points were not {}-saturated, gaining index {}".format(p,p))
                                 j = next(i for i,x in enumerate(v) if x)
-                                return (j, R)
-                            else:
-                                # points really were saturated
-                                if verbose:
-                                    print("-- points were %s-saturated" % p)
+                                return (j, pt)
+                            else: # R is not a p-multiple so the
+                                  # points were p-saturated
                                 return False
-                    else: # rank went up but is <n; carry on using more Qs
-                        rankA = newrank
-                        count = 0
+
+                        # Else we call the non-sieve version with
+                        # a list of points which are all
+                        # p-multiples modulo 15 primes, and we
+                        # will just try to divide all linear
+                        # combinations of them
+                        res = self.p_saturation(Rlist, p, sieve=False)
+                        if res:
+                            jj, R = res
+                            v = vecs[jj]
+                            # The v-linear combination of Rlist
+                            # really is p*R.  Now to enlarge the
+                            # span, we may replce the j'th point
+                            # in Plist with R, where v[j] is
+                            # non-zero.
+                            if verbose:
+                                print("-- points were not {}-saturated, gaining index {}".format(p,p))
+                            j = next(i for i,x in enumerate(v) if x)
+                            return (j, R)
+                        else:
+                            # points really were saturated
+                            if verbose:
+                                print("-- points were %s-saturated" % p)
+                            return False
+
+@parallel
+def _sieve_prime(saturator, p, q, Plist):
+    r"""Do the work of the saturation sieve at a single prime ``q``.
+
+    This is the per-prime body of the sieve in
+    :meth:`EllipticCurveSaturator.p_saturation`, split out as a
+    function so that a batch of primes can be processed in parallel.
+
+    INPUT:
+
+    - ``saturator`` -- an :class:`EllipticCurveSaturator`.
+
+    - ``p`` (integer) -- a prime number.
+
+    - ``q`` (integer) -- a rational prime, not dividing the conductor
+      norm, the field discriminant, or the denominators of the points.
+
+    OUTPUT:
+
+    A pair (``redmodq``, ``hits``) where ``redmodq`` is the reduction
+    data at ``q`` as stored in ``saturator._reductions``, and ``hits``
+    is a list of pairs (``projPlist``, ``vecs``), one for each root
+    ``amodq`` whose reduction has order divisible by ``p``, with
+    ``projPlist`` the reductions of the points of ``Plist`` and
+    ``vecs`` their projections mod ``p``.
+
+    EXAMPLES::
+
+        sage: from sage.schemes.elliptic_curves.saturation import EllipticCurveSaturator, _sieve_prime
+        sage: E = EllipticCurve('389a')
+        sage: K.<i> = QuadraticField(-1)
+        sage: EK = E.change_ring(K)
+        sage: P = EK(1+i, -1-2*i); Q = EK(0, 0); R = EK(-1, 1)
+        sage: saturator = EllipticCurveSaturator(EK)
+        sage: redmodq, hits = _sieve_prime(saturator, ZZ(19), ZZ(197), [P, Q, R])
+        sage: sorted(redmodq)
+        [14, 183]
+        sage: [projPlist for projPlist, vecs in hits]
+        [[(15 : 168 : 1), (0 : 0 : 1), (196 : 1 : 1)],
+        [(184 : 27 : 1), (0 : 0 : 1), (196 : 1 : 1)]]
+    """
+    saturator.add_reductions(q)
+    redmodq = saturator._reductions[q]
+    pint = int(p)
+    hits = []
+    for amodq, (nq, Eq) in redmodq.items():
+        if nq % pint:
+            continue
+        rm = saturator.residue_map(q, amodq)
+        projPlist = [Eq([rm(c) for c in pt]) for pt in Plist]
+        try:
+            vecs = p_projections(Eq, projPlist, p)
+        except ValueError:
+            vecs = []
+        hits.append((projPlist, vecs))
+    return redmodq, hits
 
 def p_projections(Eq, Plist, p, debug=False):
     r"""
@@ -650,21 +1376,17 @@ def p_projections(Eq, Plist, p, debug=False):
         print("m={}, n={}".format(m,n))
     if m==n: # p-primary part trivial, nothing to do
         return []
-    G = Eq.abelian_group()
-    if debug:
-        print("gens = {}".format(G.gens()))
 
     # project onto p-primary part
 
     pts  = [m*pt for pt in Plist]
-    gens = [m*g.element() for g in G.gens()]
-    gens = [g for g in gens if g]
+    gens = _p_primary_gens(Eq, p)
     if debug:
         print("gens for {}-primary part of G: {}".format(p, gens))
         print("{}*points: {}".format(m,pts))
     from sage.groups.generic import discrete_log as dlog
     from sage.modules.free_module_element import vector
-    Fp = GF(p)
+    Fp = _gf(p)
 
     # If the p-primary part is cyclic we use elliptic discrete logs directly:
 
@@ -674,7 +1396,18 @@ def p_projections(Eq, Plist, p, debug=False):
         if debug:
             print("Cyclic case, taking dlogs to base {} of order {}".format(g,pp))
         # logs are well-defined mod pp, hence mod p
-        v = [dlog(pt, g, ord=pp, operation='+') for pt in pts]
+        if pp == p:
+            # the common case of p-torsion of order exactly p: a
+            # lookup table of the p multiples of g costs p point
+            # additions, which beats baby-step-giant-step
+            table = {}
+            R = Eq(0)
+            for i in range(pp):
+                table[R] = i
+                R = R + g
+            v = [table[pt] for pt in pts]
+        else:
+            v = [dlog(pt, g, ord=pp, operation='+') for pt in pts]
         if debug:
             print("dlogs: {}".format(v))
         return [vector(Fp, v)]
@@ -693,14 +1426,45 @@ def p_projections(Eq, Plist, p, debug=False):
     # roots of unity with p1|p2, together with discrete log in the
     # multiplicative group.
 
-    zeta = g1.weil_pairing(g2, p2)  # a primitive p1'th root of unity
+    zeta = g1.weil_pairing(g2, p2)  # a root of unity of order dividing p1
     if debug:
         print("wp of gens = {} with order {}".format(zeta, zeta.multiplicative_order()))
-        assert zeta.multiplicative_order() == p1, "Weil pairing error during saturation: p={}, G={}, Plist={}".format(p, G, Plist)
-
-    # logs are well-defined mod p1, hence mod p
-
-    return [vector(Fp, [dlog(pt.weil_pairing(g1, p2), zeta,
-                             ord=p1, operation='*') for pt in pts]),
-            vector(Fp, [dlog(pt.weil_pairing(g2, p2), zeta,
-                             ord=p1, operation='*') for pt in pts])]
+        assert p1 % zeta.multiplicative_order() == 0, "Weil pairing error during saturation: p={}, gens={}, Plist={}".format(p, gens, Plist)
+
+    # logs are well-defined mod p1, hence mod p.  When p1 == p (the
+    # typical case) the pairing values are looked up in a precomputed
+    # table of the powers of zeta, instead of running a generic
+    # discrete log for each of them.
+
+    if p1 == p:
+        zeta_log = {}
+        zpow = zeta.parent().one()
+        for i in range(p1):
+            zeta_log[zpow] = i
+            zpow *= zeta
+        mdlog = zeta_log.__getitem__
+    else:
+        def mdlog(x):
+            return dlog(x, zeta, ord=p1, operation='*')
+
+    # The pairings are evaluated directly through PARI: the generators
+    # are converted once for all 2r pairings, and since everything in
+    # sight is already known to be killed by p2 the n-torsion checks
+    # that weil_pairing would repeat for every pairing are skipped, as
+    # are the pairings with the zero point, which are trivially 1.
+    from sage.libs.pari.all import pari
+    Epari = Eq.pari_curve()
+    g1pari = pari(g1)
+    g2pari = pari(g2)
+    Fq = Eq.base_field()
+    v1 = []
+    v2 = []
+    for pt in pts:
+        if pt:
+            ptpari = pari(pt)
+            v1.append(mdlog(Fq(pari.ellweilpairing(Epari, ptpari, g1pari, p2))))
+            v2.append(mdlog(Fq(pari.ellweilpairing(Epari, ptpari, g2pari, p2))))
+        else:
+            v1.append(0)
+            v2.append(0)
+    return [vector(Fp, v1), vector(Fp, v2)]